@@ -1,15 +1,19 @@
 from http.server import BaseHTTPRequestHandler
 import asyncio
+import json
 import os
 import sys
 
 # Add parent directory to path to find main_bot
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from main_bot import run_cycle
+from main_bot import run_cycle, history
 
 class handler(BaseHTTPRequestHandler):
     def do_GET(self):
+        if self.path.startswith('/stats'):
+            return self.send_stats()
+
         self.send_response(200)
         self.send_header('Content-type', 'text/plain')
         self.end_headers()
@@ -23,3 +27,26 @@ class handler(BaseHTTPRequestHandler):
         except Exception as e:
             self.wfile.write(f"Error running bot cycle: {str(e)}".encode('utf-8'))
         return
+
+    def send_stats(self):
+        # Read-only analytics endpoint, does not trigger a bot cycle
+        analytics = history.analytics
+        try:
+            stats = {
+                'summary': analytics.get_summary(),
+                'last_24h': analytics.get_window_stats(hours=24),
+                'last_50_trades': analytics.get_last_trades_stats(n=50),
+                'by_symbol': analytics.get_symbol_stats(),
+                'daily': analytics.get_daily_stats(days=30)
+            }
+        except Exception as e:
+            self.send_response(500)
+            self.send_header('Content-type', 'text/plain')
+            self.end_headers()
+            self.wfile.write(f"Error reading stats: {str(e)}".encode('utf-8'))
+            return
+
+        self.send_response(200)
+        self.send_header('Content-type', 'application/json')
+        self.end_headers()
+        self.wfile.write(json.dumps(stats).encode('utf-8'))
@@ -1,11 +1,13 @@
 import sqlite3
 import os
 from datetime import datetime
+from trade_analytics import TradeAnalytics
 
 class HistoryManager:
     def __init__(self, db_path="trade_history.db"):
         self.db_path = db_path
         self._initialize_db()
+        self.analytics = TradeAnalytics(db_path)
 
     def _initialize_db(self):
         with sqlite3.connect(self.db_path) as conn:
@@ -24,6 +26,7 @@ class HistoryManager:
                     is_closed INTEGER DEFAULT 0
                 )
             ''')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_trades_is_closed ON trades (is_closed)')
             conn.commit()
 
     def log_entry(self, symbol, side, entry_price, quantity):
@@ -58,18 +61,14 @@ class HistoryManager:
             cursor.execute('''
                 UPDATE trades 
                 SET exit_price = ?, pnl = ?, exit_time = ?, is_closed = 1 
-                WHERE id = ?
+                WHERE id = ? AND is_closed = 0
             ''', (exit_price, pnl, datetime.now(), id))
+            # Only fold first-time closes so aggregates always match the trades table
+            if cursor.rowcount == 1:
+                self.analytics.record_close(cursor, id)
             conn.commit()
 
     def get_stats(self):
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('SELECT pnl FROM trades WHERE is_closed = 1')
-            pnls = [row[0] for row in cursor.fetchall()]
-            
-            total_pnl = sum(pnls) if pnls else 0
-            wins = len([p for p in pnls if p > 0])
-            losses = len([p for p in pnls if p <= 0])
-            
-            return total_pnl, wins, losses
+        # Served from precomputed aggregates (constant time regardless of history size)
+        summary = self.analytics.get_summary()
+        return summary['total_pnl'], summary['wins'], summary['losses']
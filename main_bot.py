@@ -7,6 +7,7 @@ from termcolor import colored
 
 # Import ported modules
 from market_data import MarketDataManager
+from symbol_universe import SymbolUniverse
 from smc_analyzer import SMCAnalyzer
 from risk_manager import RiskManager
 from trade_executor import TradeExecutor
@@ -25,6 +26,7 @@ market = MarketDataManager(API_KEY, API_SECRET)
 history = HistoryManager()
 executor = TradeExecutor(market.exchange, history)
 risk = RiskManager()
+universe = SymbolUniverse(market, size=30, refresh_interval=300)
 telegram = TelegramLogger(TELEGRAM_TOKEN, TELEGRAM_CHAT_ID)
 
 # Constants (Parity with C#)
@@ -127,11 +129,13 @@ async def run_cycle():
     start_time = time.time()
     
     # 1. Dashboard Stats
-    total_pnl, wins, losses = history.get_stats()
+    summary = history.analytics.get_summary()
+    last_24h = history.analytics.get_window_stats(hours=24)
     stats_msg = (
         f"\n--- [ DASHBOARD ] {datetime.now().strftime('%H:%M:%S')} ---\n"
-        f"LIFETIME P&L: {total_pnl:.2f}%\n"
-        f"WINS: {wins} | LOSSES: {losses}\n"
+        f"LIFETIME P&L: {summary['total_pnl']:.2f}% | 24H P&L: {last_24h['total_pnl']:.2f}%\n"
+        f"WINS: {summary['wins']} | LOSSES: {summary['losses']}\n"
+        f"DRAWDOWN: {summary['drawdown']:.2f}% | MAX DRAWDOWN: {summary['max_drawdown']:.2f}%\n"
         "------------------------------------------"
     )
     print(stats_msg)
@@ -140,7 +144,7 @@ async def run_cycle():
     await sync_closed_trades()
 
     # 3. Parallel Scanning
-    symbols = await market.get_top_volume_symbols(limit=30)
+    symbols = await universe.get_symbols()
     print(f"Scanning {len(symbols)} high-volume symbols...")
     
     tasks = [scan_single_symbol(s) for s in symbols]
@@ -2,6 +2,12 @@ import ccxt.async_support as ccxt
 import pandas as pd
 import asyncio
 
+# Static Fallback (100% parity with C# fix)
+FALLBACK_SYMBOLS = [
+    "BTCUSDT", "ETHUSDT", "SOLUSDT", "BNBUSDT", "ADAUSDT", "XRPUSDT", "DOGEUSDT", 
+    "PEPEUSDT", "SHIBUSDT", "WIFUSDT", "LINKUSDT", "AVAXUSDT", "NEARUSDT"
+]
+
 class MarketDataManager:
     def __init__(self, api_key="", api_secret=""):
         self.exchange = ccxt.binance({
@@ -45,25 +51,6 @@ class MarketDataManager:
         except:
             return []
 
-    async def get_top_volume_symbols(self, limit=50):
-        try:
-            tickers = await self.exchange.fetch_tickers()
-            usdt_tickers = [t for t in tickers.values() if t['symbol'].endswith('USDT')]
-            # Sort by QuoteVolume (mirroring C# logic)
-            sorted_tickers = sorted(usdt_tickers, key=lambda x: float(x.get('quoteVolume', 0)), reverse=True)
-            symbols = [t['symbol'] for t in sorted_tickers[:limit]]
-            
-            if symbols:
-                return symbols
-        except Exception as e:
-            print(f"[ERROR] Fetching top symbols: {e}")
-
-        # Static Fallback (100% parity with C# fix)
-        return [
-            "BTCUSDT", "ETHUSDT", "SOLUSDT", "BNBUSDT", "ADAUSDT", "XRPUSDT", "DOGEUSDT", 
-            "PEPEUSDT", "SHIBUSDT", "WIFUSDT", "LINKUSDT", "AVAXUSDT", "NEARUSDT"
-        ]
-
     def calculate_atr(self, df, period=14):
         if len(df) <= period:
             return 0.0
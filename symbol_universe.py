@@ -0,0 +1,95 @@
+import time
+import numpy as np
+
+from market_data import FALLBACK_SYMBOLS
+
+class SymbolUniverse:
+    """Keeps the top quote-volume symbols in memory and refreshes them on a slow schedule."""
+
+    def __init__(self, market, size=30, refresh_interval=300, hysteresis=10, entry_margin=0.25,
+                 min_quote_volume=0.0, excluded_symbols=None, quote_asset='USDT'):
+        self.market = market
+        self.size = size
+        self.refresh_interval = refresh_interval
+        # Incumbents keep their slot while they rank inside (size + hysteresis)
+        self.hysteresis = hysteresis
+        # A core-ranked newcomer displaces the weakest incumbent only if its
+        # quote volume is at least (1 + entry_margin) times larger
+        self.entry_margin = entry_margin
+        self.min_quote_volume = min_quote_volume
+        self.excluded_symbols = set(excluded_symbols or [])
+        self.quote_asset = quote_asset
+
+        self.symbols = []
+        # Time of the last refresh attempt, successful or not
+        self.last_refresh = 0.0
+
+    def is_stale(self):
+        # Time-based only, so a failed first refresh also waits out the interval
+        return (time.time() - self.last_refresh) >= self.refresh_interval
+
+    async def get_symbols(self):
+        # Served from memory; the ticker scan only runs once per refresh interval
+        if self.is_stale():
+            await self.refresh()
+        return list(self.symbols) if self.symbols else list(FALLBACK_SYMBOLS[:self.size])
+
+    async def refresh(self):
+        try:
+            tickers = await self.market.exchange.fetch_tickers()
+            self.update_from_tickers(tickers.values())
+        except Exception as e:
+            print(f"[ERROR] Refreshing symbol universe: {e}")
+            # Back off until the next interval instead of retrying every cycle;
+            # get_symbols() serves the fallback list in the meantime
+            self.last_refresh = time.time()
+
+    def update_from_tickers(self, tickers):
+        """Re-rank from an iterable of ccxt tickers (REST snapshot or all-market ticker stream)."""
+        names = []
+        volumes = []
+        for t in tickers:
+            symbol = t.get('symbol')
+            if not symbol or not symbol.endswith(self.quote_asset) or symbol in self.excluded_symbols:
+                continue
+            names.append(symbol)
+            volumes.append(t.get('quoteVolume') or 0.0)
+
+        ranked = self.rank(np.array(names, dtype=object), np.array(volumes, dtype=float))
+        if ranked:
+            self.symbols = ranked
+        self.last_refresh = time.time()
+        return self.symbols
+
+    def rank(self, names, volumes):
+        mask = volumes >= self.min_quote_volume
+        names = names[mask]
+        volumes = volumes[mask]
+        if len(names) == 0:
+            return []
+
+        # Vectorized top-k: partition first, then sort only the (size + hysteresis) candidates
+        k = min(self.size + self.hysteresis, len(names))
+        top_idx = np.argpartition(-volumes, k - 1)[:k]
+        top_idx = top_idx[np.argsort(-volumes[top_idx], kind='stable')]
+        candidates = names[top_idx].tolist()
+        candidate_volumes = volumes[top_idx].tolist()
+
+        # Hysteresis: incumbents inside the band keep their slot and free slots go to
+        # the best core-ranked newcomers; any remaining newcomer must beat the
+        # weakest kept incumbent by `entry_margin` to take its slot
+        current = set(self.symbols)
+        kept = [i for i, s in enumerate(candidates) if s in current][:self.size]
+        entering = [i for i, s in enumerate(candidates[:self.size]) if s not in current]
+        free = self.size - len(kept)
+        selected = kept + entering[:free]
+        for i in entering[free:]:
+            weakest = max(kept)  # candidates are rank-ordered, so highest index = lowest volume
+            if candidate_volumes[i] < candidate_volumes[weakest] * (1 + self.entry_margin):
+                break
+            kept.remove(weakest)
+            selected.remove(weakest)
+            selected.append(i)
+            if not kept:
+                break
+        return [candidates[i] for i in sorted(selected)]
@@ -0,0 +1,226 @@
+import sqlite3
+from datetime import datetime, timedelta
+
+class TradeAnalytics:
+    """Incrementally maintained aggregates over the trades table.
+
+    Every closed trade is appended once to `equity_curve` with cumulative
+    equity/wins/drawdown, so windowed queries are a difference of two indexed rows.
+    """
+
+    def __init__(self, db_path="trade_history.db"):
+        self.db_path = db_path
+        self._initialize_db()
+
+    def _initialize_db(self):
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS equity_curve (
+                    seq INTEGER PRIMARY KEY,
+                    trade_id INTEGER NOT NULL UNIQUE,
+                    symbol TEXT NOT NULL,
+                    side TEXT NOT NULL,
+                    exit_time DATETIME NOT NULL,
+                    pnl REAL NOT NULL,
+                    equity REAL NOT NULL,
+                    wins INTEGER NOT NULL,
+                    peak REAL NOT NULL,
+                    drawdown REAL NOT NULL,
+                    max_drawdown REAL NOT NULL
+                )
+            ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS symbol_stats (
+                    symbol TEXT NOT NULL,
+                    side TEXT NOT NULL,
+                    trades INTEGER NOT NULL DEFAULT 0,
+                    wins INTEGER NOT NULL DEFAULT 0,
+                    losses INTEGER NOT NULL DEFAULT 0,
+                    total_pnl REAL NOT NULL DEFAULT 0,
+                    PRIMARY KEY (symbol, side)
+                )
+            ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS daily_stats (
+                    day TEXT PRIMARY KEY,
+                    trades INTEGER NOT NULL DEFAULT 0,
+                    wins INTEGER NOT NULL DEFAULT 0,
+                    losses INTEGER NOT NULL DEFAULT 0,
+                    total_pnl REAL NOT NULL DEFAULT 0
+                )
+            ''')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_equity_curve_exit_time ON equity_curve (exit_time)')
+
+            # Backfill trades closed before analytics existed (no-op once in sync)
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'trades'")
+            if cursor.fetchone() is None:
+                conn.commit()
+                return
+            cursor.execute('''
+                SELECT id FROM trades
+                WHERE is_closed = 1 AND id NOT IN (SELECT trade_id FROM equity_curve)
+                ORDER BY exit_time, id
+            ''')
+            out_of_order = False
+            for (trade_id,) in cursor.fetchall():
+                out_of_order = self.record_close(cursor, trade_id, resequence=False) or out_of_order
+            # Trades closed by an older deployment can predate the curve tail
+            if out_of_order:
+                self._resequence(cursor)
+            conn.commit()
+
+    def record_close(self, cursor, trade_id, resequence=True):
+        """Fold one closed trade into the aggregates. Runs inside the caller's transaction.
+
+        Returns True if the trade closed before the current curve tail. The curve is then
+        re-sequenced, unless `resequence` is False and the caller does it once at the end.
+        """
+        cursor.execute('SELECT symbol, side, pnl, exit_time FROM trades WHERE id = ? AND is_closed = 1', (trade_id,))
+        row = cursor.fetchone()
+        if row is None:
+            return False
+        cursor.execute('SELECT 1 FROM equity_curve WHERE trade_id = ?', (trade_id,))
+        if cursor.fetchone() is not None:
+            return False
+
+        symbol, side, pnl, exit_time = row
+        pnl = pnl or 0.0
+        is_win = 1 if pnl > 0 else 0
+
+        cursor.execute('SELECT seq, equity, wins, peak, max_drawdown, exit_time FROM equity_curve ORDER BY seq DESC LIMIT 1')
+        last = cursor.fetchone() or (0, 0.0, 0, 0.0, 0.0, None)
+        out_of_order = last[5] is not None and str(exit_time) < str(last[5])
+        equity = last[1] + pnl
+        peak = max(last[3], equity)
+        drawdown = peak - equity
+        max_drawdown = max(last[4], drawdown)
+
+        # Invariant: exit_time never decreases as seq increases. get_window_stats()
+        # takes MIN(seq) over a time window and treats every later row as inside it,
+        # so a back-dated close is appended and then the curve is re-sequenced.
+        cursor.execute('''
+            INSERT INTO equity_curve (seq, trade_id, symbol, side, exit_time, pnl, equity, wins, peak, drawdown, max_drawdown)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (last[0] + 1, trade_id, symbol, side, exit_time, pnl, equity, last[2] + is_win, peak, drawdown, max_drawdown))
+
+        cursor.execute('''
+            INSERT INTO symbol_stats (symbol, side, trades, wins, losses, total_pnl)
+            VALUES (?, ?, 1, ?, ?, ?)
+            ON CONFLICT (symbol, side) DO UPDATE SET
+                trades = trades + 1,
+                wins = wins + excluded.wins,
+                losses = losses + excluded.losses,
+                total_pnl = total_pnl + excluded.total_pnl
+        ''', (symbol, side, is_win, 1 - is_win, pnl))
+
+        cursor.execute('''
+            INSERT INTO daily_stats (day, trades, wins, losses, total_pnl)
+            VALUES (?, 1, ?, ?, ?)
+            ON CONFLICT (day) DO UPDATE SET
+                trades = trades + 1,
+                wins = wins + excluded.wins,
+                losses = losses + excluded.losses,
+                total_pnl = total_pnl + excluded.total_pnl
+        ''', (str(exit_time)[:10], is_win, 1 - is_win, pnl))
+
+        if out_of_order and resequence:
+            self._resequence(cursor)
+        return out_of_order
+
+    def _resequence(self, cursor):
+        # Rebuild seq and the cumulative columns in exit_time order (O(n), rare)
+        cursor.execute('SELECT trade_id, symbol, side, exit_time, pnl FROM equity_curve ORDER BY exit_time, trade_id')
+        rows = cursor.fetchall()
+        rebuilt = []
+        equity = peak = max_drawdown = 0.0
+        wins = 0
+        for seq, (trade_id, symbol, side, exit_time, pnl) in enumerate(rows, start=1):
+            equity += pnl
+            wins += 1 if pnl > 0 else 0
+            peak = max(peak, equity)
+            drawdown = peak - equity
+            max_drawdown = max(max_drawdown, drawdown)
+            rebuilt.append((seq, trade_id, symbol, side, exit_time, pnl, equity, wins, peak, drawdown, max_drawdown))
+        cursor.execute('DELETE FROM equity_curve')
+        cursor.executemany('''
+            INSERT INTO equity_curve (seq, trade_id, symbol, side, exit_time, pnl, equity, wins, peak, drawdown, max_drawdown)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', rebuilt)
+
+    def _window(self, cursor, first_seq):
+        # Window stats = last cumulative row minus the row just before the window
+        cursor.execute('SELECT seq, equity, wins FROM equity_curve ORDER BY seq DESC LIMIT 1')
+        last = cursor.fetchone()
+        if last is None or first_seq is None or first_seq > last[0]:
+            return {'trades': 0, 'wins': 0, 'losses': 0, 'total_pnl': 0.0}
+        cursor.execute('SELECT equity, wins FROM equity_curve WHERE seq = ?', (first_seq - 1,))
+        base = cursor.fetchone() or (0.0, 0)
+        trades = last[0] - (first_seq - 1)
+        wins = last[2] - base[1]
+        return {'trades': trades, 'wins': wins, 'losses': trades - wins, 'total_pnl': last[1] - base[0]}
+
+    def get_summary(self):
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT seq, equity, wins, drawdown, max_drawdown FROM equity_curve ORDER BY seq DESC LIMIT 1')
+            row = cursor.fetchone() or (0, 0.0, 0, 0.0, 0.0)
+            trades, equity, wins, drawdown, max_drawdown = row
+            return {
+                'trades': trades,
+                'wins': wins,
+                'losses': trades - wins,
+                'win_rate': (wins / trades * 100) if trades else 0.0,
+                'total_pnl': equity,
+                'drawdown': drawdown,
+                'max_drawdown': max_drawdown
+            }
+
+    def get_last_trades_stats(self, n=50):
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT MAX(seq) FROM equity_curve')
+            last_seq = cursor.fetchone()[0] or 0
+            return self._window(cursor, max(last_seq - n + 1, 1))
+
+    def get_window_stats(self, hours=24):
+        since = datetime.now() - timedelta(hours=hours)
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT MIN(seq) FROM equity_curve WHERE exit_time >= ?', (since,))
+            return self._window(cursor, cursor.fetchone()[0])
+
+    def get_symbol_stats(self, symbol=None):
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            if symbol:
+                cursor.execute('SELECT symbol, side, trades, wins, losses, total_pnl FROM symbol_stats WHERE symbol = ?', (symbol,))
+            else:
+                cursor.execute('SELECT symbol, side, trades, wins, losses, total_pnl FROM symbol_stats ORDER BY total_pnl DESC')
+            return [
+                {'symbol': r[0], 'side': r[1], 'trades': r[2], 'wins': r[3], 'losses': r[4], 'total_pnl': r[5]}
+                for r in cursor.fetchall()
+            ]
+
+    def get_daily_stats(self, days=30):
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT day, trades, wins, losses, total_pnl FROM daily_stats ORDER BY day DESC LIMIT ?', (days,))
+            return [
+                {'day': r[0], 'trades': r[1], 'wins': r[2], 'losses': r[3], 'total_pnl': r[4]}
+                for r in cursor.fetchall()
+            ]
+
+    def get_equity_curve(self, limit=500):
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT seq, trade_id, exit_time, pnl, equity, drawdown, max_drawdown
+                FROM equity_curve ORDER BY seq DESC LIMIT ?
+            ''', (limit,))
+            rows = cursor.fetchall()
+            return [
+                {'seq': r[0], 'trade_id': r[1], 'exit_time': r[2], 'pnl': r[3],
+                 'equity': r[4], 'drawdown': r[5], 'max_drawdown': r[6]}
+                for r in reversed(rows)
+            ]